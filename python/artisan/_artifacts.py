@@ -11,22 +11,30 @@ that intended to be used as attribute type annotations within `Artifact`
 subclass definition.
 '''
 
-import itertools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import hashlib
 import json
+import os
 from pathlib import Path
+import re
 import shutil
+import stat
 import threading
+import uuid
 from time import sleep
 from typing import (
-    Any, Iterator, List, Mapping, MutableMapping,
+    Any, Dict, Iterator, List, Mapping, MutableMapping,
     Optional, Tuple, cast
 )
 from typing_extensions import Protocol
 
 import h5py as h5
 import numpy as np
-from ruamel import yaml
+from ruamel.yaml import YAML
 
+from . import _configurables
 from ._configurables import Configurable, get_scope
 from ._namespaces import Namespace, namespacify
 
@@ -136,7 +144,7 @@ class Artifact(Configurable):
         '''
         The metadata stored in `{self.path}/_meta.yaml`
         '''
-        return _read_meta(self.path)
+        return copy.deepcopy(_read_meta(self.path))
 
     #-- MutableMapping methods ----------------------------
 
@@ -146,7 +154,7 @@ class Artifact(Configurable):
 
         Non-public files (files whose names start with "_") are not counted.
         '''
-        return sum(1 for _ in self.path.glob('[!_]*'))
+        return sum(1 for _ in self)
 
     def __iter__(self) -> Iterator[str]:
         '''
@@ -156,8 +164,13 @@ class Artifact(Configurable):
         without extensions. Non-public files (files whose names start with "_")
         are ignored.
         '''
-        for p in self.path.glob('[!_]*'):
-            yield p.name[:-3] if p.suffix == '.h5' else p.name
+        try:
+            with os.scandir(self.path) as entries:
+                names = [e.name for e in entries if not e.name.startswith('_')]
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        for name in names:
+            yield name[:-3] if name.endswith('.h5') else name
 
     def keys(self) -> Iterator[str]:
         return self.__iter__()
@@ -176,19 +189,7 @@ class Artifact(Configurable):
         attributes (i.e. `artifact['name.ext']` is equivalent to
         `artifact.name__ext`).
         '''
-        path = self.path / key
-
-        # Return an array.
-        if path.with_suffix('.h5').is_file():
-            return _read_h5(path.with_suffix('.h5'))
-
-        # Return the path to a file.
-        elif path.is_file():
-            return path
-
-         # Return a subrecord
-        else:
-            return Artifact(path)
+        return _read_entry(*_classify(self.path / key))
 
     def __setitem__(self, key: str, val: object) -> None:
         '''
@@ -229,14 +230,10 @@ class Artifact(Configurable):
         attributes (i.e. `del artifact['name.ext']` is equivalent to
         `del artifact.name__ext`).
         '''
-        path = self.path / key
-
-        # Delete an array file.
-        if path.with_suffix('.h5').is_file():
-            path.with_suffix('.h5').unlink()
+        kind, path = _classify(self.path / key)
 
-        # Delete a non-array file.
-        elif path.is_file():
+        # Delete an array or non-array file.
+        if kind in ('array', 'file'):
             path.unlink()
 
         # Delete an artifact.
@@ -286,6 +283,9 @@ class Artifact(Configurable):
     #-- Attribute preemption, for REPL autocompletion -----
 
     def __getattribute__(self, key: str) -> Any:
+        # `_cached_keys` never contains private names or names that shadow
+        # class/instance attributes (see `__dir__`), so e.g. `self.path` only
+        # costs a set lookup, and never touches the file system.
         if key in object.__getattribute__(self, '_cached_keys'):
             try:
                 object.__setattr__(self, key, self[key])
@@ -299,9 +299,11 @@ class Artifact(Configurable):
             object.__delattr__(self, key)
         self._cached_keys.clear()
 
-        for key in set(self).difference(object.__dir__(self)):
-            object.__setattr__(self, key, self[key])
-            self._cached_keys.add(key)
+        attrs = set(object.__dir__(self))
+        for key, (kind, path) in _scan(self.path).items():
+            if key not in attrs:
+                object.__setattr__(self, key, _read_entry(kind, path))
+                self._cached_keys.add(key)
 
         return cast(list, object.__dir__(self))
 
@@ -397,19 +399,41 @@ def _artifact_from_conf(cls: type, conf: Mapping[str, object]) -> Artifact:
     object.__setattr__(artifact, '_cached_keys', set())
     spec = Namespace(type=_identify(type(artifact)), **artifact.conf)
 
-    for path in Path(get_root_dir()).glob('*'):
-        meta = _read_meta(path)
-        if meta.spec == spec:
-            while meta.status == 'running':
-                sleep(0.01)
-                meta = _read_meta(path)
-            if meta.status == 'done':
-                object.__setattr__(artifact, 'path', path)
-                return artifact
+    path = _find_built_artifact(spec)
+    if path is not None:
+        object.__setattr__(artifact, 'path', path)
     else:
         object.__setattr__(artifact, 'path', _new_artifact_path(type(artifact)))
         _build(artifact)
-        return artifact
+    return artifact
+
+
+def _find_built_artifact(spec: Namespace) -> Optional[Path]:
+    '''
+    Return the path to a successfully built artifact in the root directory
+    with the given spec, if one exists.
+
+    Candidates are looked up by spec hash in the root directory's index, which
+    is created from a full scan of the root directory if it doesn't exist.
+    '''
+    root = Path(get_root_dir())
+    try:
+        digest = _spec_digest(_identify_elements(spec))
+    except (TypeError, ValueError):
+        # Specs that can't be hashed aren't indexed, so every directory in
+        # the root directory is a candidate.
+        names = [p.name for p in _subdirectories(root)]
+    else:
+        index = _read_index(root)
+        if index is None:
+            index = _create_index(root)
+        names = list(index.get(digest, ()))
+    for name in names:
+        path = root / name
+        meta = _read_meta(path)
+        if meta.spec == spec and _await_build(path, meta).status == 'done':
+            return path
+    return None
 
 
 def _artifact_from_path_and_conf(cls: type,
@@ -426,10 +450,8 @@ def _artifact_from_path_and_conf(cls: type,
         meta = _read_meta(path)
         if meta.spec != {'type': _identify(type(artifact)), **artifact.conf}:
             raise FileExistsError(f'"{artifact.path}" (incompatible spec)')
-        while meta.status == 'running':
-            sleep(0.01)
-            meta = _read_meta(path)
-        if artifact.meta.status == 'stopped':
+        meta = _await_build(path, meta)
+        if meta.status == 'stopped':
             raise FileExistsError(f'"{artifact.path}" was stopped mid-build.')
     else:
         _build(artifact)
@@ -444,24 +466,58 @@ def _build(artifact: Artifact) -> None:
     # TODO: Fix YAML generation.
     meta_path = artifact.path / '_meta.yaml'
     spec = Namespace(type=_identify(type(artifact)), **artifact.conf)
-    write_meta = lambda **kwargs: meta_path.write_text(
-        json.dumps(_identify_elements(kwargs))
-    )
+    spec_elems = _identify_elements(spec)
+    spec_json = json.dumps(spec_elems)
+
+    def write_meta(status: str) -> None:
+        _write_atomically(
+            meta_path,
+            f'{{"spec": {spec_json}, "status": {json.dumps(status)}}}'
+        )
+        with _cache_lock:
+            _meta_cache.pop(str(meta_path), None)
 
     artifact.path.mkdir(parents=True)
-    write_meta(spec=spec, status='running')
+    write_meta('running')
 
     try:
+        if _is_in_root_dir(artifact.path):
+            _add_to_index(artifact.path.parent, spec_elems, artifact.path.name)
         if callable(getattr(type(artifact), 'build', None)):
             n_build_args = artifact.build.__code__.co_argcount
             build_args = [artifact.conf] if n_build_args > 1 else []
             artifact.build(*build_args)
-        write_meta(spec=spec, status='done')
+        write_meta('done')
     except BaseException as e:
-        write_meta(spec=spec, status='stopped')
+        write_meta('stopped')
         raise e
 
 
+def _await_build(path: Path, meta: Namespace) -> Namespace:
+    '''
+    Wait for the build at `path` to stop running, and return its metadata.
+
+    `meta` is the most recently read metadata. The polling interval starts at
+    1ms and doubles up to 0.5s, so long builds don't keep waiters busy.
+    '''
+    delay = 0.001
+    while meta.status == 'running':
+        sleep(delay)
+        delay = min(2 * delay, 0.5)
+        meta = _read_meta(path)
+    return meta
+
+
+def _is_in_root_dir(path: Path) -> bool:
+    '''
+    Return whether `path` is a direct child of the root directory.
+    '''
+    try:
+        return os.path.samefile(path.parent, get_root_dir())
+    except FileNotFoundError:
+        return False
+
+
 def _resolve_path(path: Path) -> Path:
     '''
     Dereference ".", "..", "~", and "@".
@@ -471,24 +527,284 @@ def _resolve_path(path: Path) -> Path:
     return path.expanduser().resolve()
 
 
+_next_artifact_indices: Dict[Tuple[str, str], int] = {}
+
 def _new_artifact_path(type_: type) -> Path:
     '''
     Generate an unused path in the artifact root directory.
+
+    The root directory is scanned once per type to find the highest index in
+    use. Subsequent calls continue from a cached index.
     '''
     root = Path(get_root_dir())
     type_name = _identify(type_)
-    for i in itertools.count():
-        dst = root / f'{type_name}_{i:04x}'
-        if not dst.exists():
-            return dst
-    assert False # for MyPy
+    key = os.path.abspath(root), type_name
+    i = _next_artifact_indices.get(key)
+    if i is None:
+        i = _index_after_highest(root, type_name)
+    while (root / f'{type_name}_{i:04x}').exists():
+        i += 1
+    _next_artifact_indices[key] = i + 1
+    return root / f'{type_name}_{i:04x}'
+
+
+def _index_after_highest(root: Path, type_name: str) -> int:
+    '''
+    Return one more than the highest index `i` such that
+    `{root}/{type_name}_{i:04x}` exists, or 0 if there is no such index.
+    '''
+    pattern = re.compile(re.escape(type_name) + '_([0-9a-f]{4,})')
+    i_next = 0
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                match = pattern.fullmatch(entry.name)
+                if match is not None:
+                    i_next = max(i_next, int(match.group(1), 16) + 1)
+    except FileNotFoundError:
+        pass
+    return i_next
+
+#-- Spec index ----------------------------------------------------------------
+#
+# Each root directory has an append-only index, `_index.jsonl`, with a line
+# `{"h": <spec hash>, "p": <entry name>}` for every artifact built in it. The
+# index only narrows down candidates; matches are confirmed against the
+# candidates' metadata.
+
+_index_cache: (
+    'OrderedDict[str, Tuple[int, int, Dict[str, Tuple[str, ...]]]]'
+) = OrderedDict()
+_max_cached_indices = 16
+_n_scan_threads = min(32, 4 * (os.cpu_count() or 1))
+_min_scan_batch_size = 256
+
+def _spec_digest(spec: object) -> str:
+    '''
+    Return a hash of a JSON-serializable spec.
+
+    Keys are sorted in their JSON (string) form, so dicts that mix key types
+    can be hashed.
+    '''
+    try:
+        content = json.dumps(spec, sort_keys=True)
+    except TypeError:
+        content = json.dumps(json.loads(json.dumps(spec)), sort_keys=True)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _read_index(root: Path) -> Optional[Dict[str, Tuple[str, ...]]]:
+    '''
+    Return the mapping from spec hashes to entry names stored in
+    `{root}/_index.jsonl`, or `None` if the index doesn't exist.
+
+    Parsed indices are cached, and only lines appended since the last read are
+    parsed.
+    '''
+    index_path = root / '_index.jsonl'
+    try:
+        f = open(index_path, 'rb')
+    except FileNotFoundError:
+        return None
+
+    with f:
+        st = os.fstat(f.fileno())
+        ino, n_parsed, index = (
+            _cache_get(_index_cache, str(index_path)) or (0, 0, {})
+        )
+        if ino != st.st_ino or n_parsed > st.st_size:
+            n_parsed, index = 0, {}
+        if n_parsed == st.st_size:
+            return index
+        f.seek(n_parsed)
+        content = f.read()
+
+    # Ignore trailing partial lines; they'll be parsed once complete.
+    n_complete = content.rfind(b'\n') + 1
+    index = dict(index)
+    for line in content[:n_complete].splitlines():
+        try:
+            entry = json.loads(line)
+            index[entry['h']] = index.get(entry['h'], ()) + (entry['p'],)
+        except (ValueError, KeyError, TypeError):
+            pass
+    _cache_put(
+        _index_cache, str(index_path),
+        (st.st_ino, n_parsed + n_complete, index), _max_cached_indices
+    )
+    return index
+
+
+def _create_index(root: Path) -> Dict[str, Tuple[str, ...]]:
+    '''
+    Scan `root` for artifacts, and write an index for them, unless another
+    process or thread does so first. Return the resulting index.
+
+    If the index can't be written (e.g. because `root` is read-only), the
+    result of the scan is returned without writing it.
+    '''
+    paths = _subdirectories(root)
+    index: Dict[str, Tuple[str, ...]] = {}
+    lines = []
+    for path, meta in zip(paths, _read_metas(paths)):
+        if meta.spec is None:
+            continue
+        try:
+            digest = _spec_digest(meta.spec)
+        except (TypeError, ValueError):
+            continue
+        index[digest] = index.get(digest, ()) + (path.name,)
+        lines.append(json.dumps({'h': digest, 'p': path.name}) + '\n')
+
+    tmp_path = root / f'_index.{uuid.uuid4().hex}.tmp'
+    try:
+        with open(tmp_path, 'x') as f:
+            f.write(''.join(lines))
+        os.link(tmp_path, root / '_index.jsonl')
+    except FileExistsError:
+        pass
+    except OSError:
+        return index
+    finally:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+    return _read_index(root) or index
+
+
+def _add_to_index(root: Path, spec: object, name: str) -> None:
+    '''
+    Record that the artifact `{root}/{name}` has the given (JSON-serializable)
+    spec.
+
+    If the index doesn't exist yet, it's created from a scan of `root`, which
+    already includes the artifact if its metadata has been written. Nothing is
+    recorded if the index can't be created, since a partial index would hide
+    the artifacts missing from it.
+    '''
+    digest = _spec_digest(spec)
+    if not (root / '_index.jsonl').exists():
+        if name in _create_index(root).get(digest, ()):
+            return
+    try:
+        fd = os.open(root / '_index.jsonl', os.O_WRONLY | os.O_APPEND)
+    except FileNotFoundError:
+        return
+    with os.fdopen(fd, 'w') as f:
+        f.write(json.dumps({'h': digest, 'p': name}) + '\n')
+
+
+def _subdirectories(root: Path) -> List[Path]:
+    '''
+    Return the paths of the directories directly under `root`.
+    '''
+    try:
+        with os.scandir(root) as entries:
+            return [Path(e.path) for e in entries if e.is_dir()]
+    except FileNotFoundError:
+        return []
+
+
+def _read_metas(paths: List[Path]) -> List[Namespace]:
+    '''
+    Return the metadata for each path in `paths`.
+
+    Paths are split into batches whose metadata files are read concurrently,
+    since scanning a large root directory on a network file system is
+    dominated by latency.
+    '''
+    n_batches = max(1, min(
+        _n_scan_threads,
+        int(np.ceil(len(paths) / _min_scan_batch_size))
+    ))
+    batch_size = int(np.ceil(len(paths) / n_batches))
+    batches = [
+        paths[i:i + batch_size]
+        for i in range(0, len(paths), max(1, batch_size))
+    ]
+    with ThreadPoolExecutor(n_batches) as executor:
+        return [
+            meta
+            for batch in executor.map(
+                lambda batch: [_read_meta(p) for p in batch], batches
+            )
+            for meta in batch
+        ]
 
 #-- I/O -----------------------------------------------------------------------
 
+_min_chunk_size = 2**16 # bytes
+_chunk_cache_size = 2**22 # bytes
+
+
+def _read_entry(kind: str, path: Path) -> Any:
+    '''
+    Return the entry at `path`, given its classification.
+    '''
+    # Return an array.
+    if kind == 'array':
+        return _read_h5(path)
+
+    # Return the path to a file.
+    elif kind == 'file':
+        return path
+
+    # Return a subrecord
+    else:
+        return Artifact(path)
+
+
+def _scan(path: Path) -> Dict[str, Tuple[str, Path]]:
+    '''
+    Return `{key: _classify(path / key)}` for each public entry in `path`.
+
+    Entries are classified from a single directory scan, rather than by
+    `stat`ing each candidate path.
+    '''
+    try:
+        with os.scandir(path) as entries:
+            public = [e for e in entries if not e.name.startswith('_')]
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+    files = {e.name for e in public if e.is_file()}
+    result: Dict[str, Tuple[str, Path]] = {}
+    for e in public:
+        key = e.name[:-3] if e.name.endswith('.h5') else e.name
+        h5_name = os.path.splitext(key)[0] + '.h5'
+        if h5_name in files:
+            result[key] = 'array', path / h5_name
+        elif key in files:
+            result[key] = 'file', path / key
+        else:
+            result[key] = 'other', path / key
+    return result
+
+
+def _classify(path: Path) -> Tuple[str, Path]:
+    '''
+    Return `("array", path_to_h5_file)`, `("file", path)`, or `("other", path)`.
+
+    Each candidate path is `stat`ed at most once.
+    '''
+    h5_path = path.with_suffix('.h5')
+    for kind, p in (('array', h5_path), ('file', path)):
+        try:
+            if stat.S_ISREG(os.stat(p).st_mode):
+                return kind, p
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+    return 'other', path
+
+
 def _read_h5(path: Path) -> ArrayFile:
     try:
-        f = h5.File(path, 'r', libver='latest', swmr=True)
-        return f['data']
+        f = h5.File(
+            path, 'r', libver='latest', swmr=True,
+            rdcc_nbytes=_chunk_cache_size
+        )
+        return cast(ArrayFile, _MappedDataset(f['data'].id))
     except OSError as e:
         if 'errno = 2' in str(e): # 2 := File not found.
             raise e
@@ -496,45 +812,113 @@ def _read_h5(path: Path) -> ArrayFile:
         return _read_h5(path)
 
 
+class _MappedDataset(h5.Dataset):
+    '''
+    A read-only dataset that serves basic (integer/slice) indexing from a
+    memory map of its file, when its data is stored contiguously
+
+    Other forms of indexing, reads with a dtype conversion (`astype`,
+    `fields`), and datasets that can't be memory-mapped, are handled by
+    `h5.Dataset`.
+    '''
+    def __getitem__(self, args: Any, new_dtype: Any = None) -> Any:
+        if new_dtype is not None:
+            return h5.Dataset.__getitem__(self, args, new_dtype=new_dtype)
+        if '_memmap' not in self.__dict__:
+            self.__dict__['_memmap'] = _memmap_h5(self)
+        memmap = self.__dict__['_memmap']
+        if memmap is None or not _is_basic_index(args):
+            return h5.Dataset.__getitem__(self, args)
+        result = memmap[args]
+        return np.array(result) if isinstance(result, np.ndarray) else result
+
+
+def _memmap_h5(dset: h5.Dataset) -> Optional[np.memmap]:
+    '''
+    Return a read-only memory map of `dset`'s data, or `None` if it is not
+    stored contiguously, uncompressed, and in a plain, read-only file.
+    '''
+    if (dset.chunks is not None
+        or getattr(dset, 'external', None)
+        or dset.file.mode != 'r'
+        or dset.file.driver != 'sec2'
+        or dset.dtype.kind not in 'biufc'
+        or dset.shape == ()
+        or dset.size == 0):
+        return None
+    offset = dset.id.get_offset()
+    if offset is None:
+        return None
+    return np.memmap(
+        dset.file.filename, dtype=dset.dtype,
+        mode='r', offset=offset, shape=dset.shape
+    )
+
+
+def _is_basic_index(args: object) -> bool:
+    '''
+    Return whether `args` consists only of integers, ellipses, and slices
+    with positive steps (`h5.Dataset` rejects other steps, so they're left to
+    it to report).
+    '''
+    return all(
+        (isinstance(a, (int, np.integer)) and not isinstance(a, bool))
+        or (isinstance(a, slice) and (a.step is None or a.step > 0))
+        or a is Ellipsis
+        for a in (args if isinstance(args, tuple) else (args,))
+    )
+
+
 def _write_h5(path: Path, val: object) -> None:
     val = np.asarray(val)
     try:
-        f = h5.File(path, libver='latest')
-        if f['data'].dtype != val.dtype:
-            raise ValueError()
-        f['data'][...] = val
+        with h5.File(path, 'a', libver='latest') as f:
+            if f['data'].dtype != val.dtype:
+                raise ValueError()
+            f['data'][...] = val
     except Exception:
         path.parent.mkdir(parents=True, exist_ok=True)
         if path.is_dir(): path.rmdir()
         elif path.exists(): path.unlink()
-        f = h5.File(path, libver='latest')
-        f['data'] = val
-        f.swmr_mode = True
+        with h5.File(path, 'a', libver='latest') as f:
+            f['data'] = val
+            f.swmr_mode = True
 
 
 def _extend_h5(path: Path, val: object) -> None:
     val = np.asarray(val)
     path.parent.mkdir(parents=True, exist_ok=True)
-    f = h5.File(path, libver='latest')
-    if 'data' not in f:
-        dset = f.require_dataset(
-            name = 'data',
-            shape = None,
-            maxshape = (None, *val.shape[1:]),
-            dtype = val.dtype,
-            data = np.empty((0, *val.shape[1:]), val.dtype),
-            chunks = (
-                int(np.ceil(2**12 / np.prod(val.shape[1:]))),
-                *val.shape[1:]
+    with h5.File(
+        path, 'a', libver='latest', rdcc_nbytes=_chunk_cache_size
+    ) as f:
+        if 'data' not in f:
+            dset = f.require_dataset(
+                name = 'data',
+                shape = None,
+                maxshape = (None, *val.shape[1:]),
+                dtype = val.dtype,
+                data = np.empty((0, *val.shape[1:]), val.dtype),
+                chunks = (_chunk_len(val), *val.shape[1:])
             )
-        )
-        f.swmr_mode = True
-    else:
-        dset = f['data']
-    if len(val) > 0:
-        dset.resize(dset.len() + len(val), 0)
-        dset[-len(val):] = val
-        dset.flush()
+            f.swmr_mode = True
+        else:
+            dset = f['data']
+        if len(val) > 0:
+            dset.resize(dset.len() + len(val), 0)
+            dset[-len(val):] = val
+            dset.flush()
+
+
+def _chunk_len(val: np.ndarray) -> int:
+    '''
+    Return the number of rows per chunk to use when storing an extensible
+    array with the same row shape and dtype as `val`.
+
+    Chunks are at least `_min_chunk_size` bytes, since smaller chunks inflate
+    the HDF5 chunk index and the number of I/O operations per read.
+    '''
+    row_size = max(1, int(np.prod(val.shape[1:])) * val.dtype.itemsize)
+    return max(1, int(np.ceil(_min_chunk_size / row_size)))
 
 
 def _copy_file(dst: Path, src: Path) -> None:
@@ -547,32 +931,168 @@ def _extend_file(dst: Path, src: Path) -> None:
     dst.parent.mkdir(parents=True, exist_ok=True)
     with open(src, 'rb') as f_src:
         with open(dst, 'ab+') as f_dst:
-            f_dst.write(f_src.read())
+            shutil.copyfileobj(f_src, f_dst, 2**20)
 
 
+def _write_atomically(path: Path, content: str) -> None:
+    '''
+    Write `content` to a temporary file, then move it to `path`, so readers
+    never observe a partially written file.
+    '''
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_text(content)
+    os.replace(tmp_path, path)
+
+
+_yaml = YAML(typ='safe')
+_yaml_lock = threading.Lock()
+_meta_cache: 'OrderedDict[str, Tuple[Tuple[int, int, int], Namespace]]' = (
+    OrderedDict()
+)
+_max_cached_metas = 4096
+
 def _read_meta(path: Path) -> Namespace:
-    # TODO: Implement caching
+    '''
+    Return the metadata stored in `{path}/_meta.yaml`.
+
+    Parsed metadata is cached, keyed on the file's inode, modification time,
+    and size, so rereading an unchanged file costs a single `stat` call. The
+    returned namespace is shared, and should not be mutated. The cache holds
+    the `_max_cached_metas` most recently used files.
+    '''
+    meta_path = path / '_meta.yaml'
+    try:
+        st = os.stat(meta_path)
+    except OSError:
+        return Namespace(spec=None, status='done')
+
+    version = st.st_ino, st.st_mtime_ns, st.st_size
+    cached = _cache_get(_meta_cache, str(meta_path))
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
     try:
-        meta = namespacify(yaml.safe_load((path/'_meta.yaml').read_text()))
+        meta = namespacify(_parse_meta(meta_path.read_bytes()))
         assert isinstance(meta, Namespace)
         assert isinstance(meta.spec, Namespace)
         assert isinstance(meta.status, str)
-        return meta
     except:
-        return Namespace(spec=None, status='done')
+        meta = Namespace(spec=None, status='done')
+    _cache_put(_meta_cache, str(meta_path), (version, meta), _max_cached_metas)
+    return meta
+
+
+def _parse_meta(content: bytes) -> object:
+    '''
+    Parse the contents of a `_meta.yaml` file.
+
+    Artisan writes metadata as JSON (a subset of YAML), so the JSON parser is
+    tried first. The YAML parser handles hand-edited files.
+    '''
+    try:
+        return json.loads(content)
+    except ValueError:
+        with _yaml_lock:
+            return _yaml.load(content.decode())
+
+
+_cache_lock = threading.Lock()
+
+def _cache_get(cache: 'OrderedDict[str, Any]', key: str) -> Any:
+    '''
+    Return the value cached under `key`, or `None`, and mark it as the most
+    recently used.
+    '''
+    with _cache_lock:
+        val = cache.get(key)
+        if val is not None:
+            cache.move_to_end(key)
+        return val
+
+
+def _cache_put(cache: 'OrderedDict[str, Any]',
+               key: str, val: Any, max_size: int) -> None:
+    '''
+    Cache `val` under `key`, evicting the least recently used entries to keep
+    the cache within `max_size` entries.
+    '''
+    with _cache_lock:
+        cache[key] = val
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
 
 #-- Scope search --------------------------------------------------------------
 
-def _identify(type_: type) -> str:
-    return next(sym for sym, t in get_scope().items() if t == type_)
+def _identify(type_: type, scope: Optional[Dict[str, type]] = None) -> str:
+    '''
+    Return the first symbol bound to `type_` in `scope` (by default, the
+    current scope).
+
+    If `scope` is the one set with `set_scope`, its reverse (type-to-symbol)
+    mapping is cached, and rebuilt when the scope object or its size changes.
+    Other scopes, including the default scope, which is rebuilt on every
+    `get_scope` call, are searched linearly.
+    '''
+    scope = get_scope() if scope is None else scope
+    if scope is not getattr(_configurables.context, 'scope', None):
+        return next(sym for sym, t in scope.items() if t == type_)
+
+    cached = getattr(context, 'reverse_scope', None)
+    if cached is None or cached[0] is not scope or cached[1] != len(scope):
+        reverse_scope: Dict[type, str] = {}
+        for sym, t in scope.items():
+            reverse_scope.setdefault(t, sym)
+        cached = context.reverse_scope = scope, len(scope), reverse_scope
+
+    sym = cached[2].get(type_)
+    if sym is not None and scope.get(sym) is type_:
+        return sym
+    else:
+        return next(sym for sym, t in scope.items() if t == type_)
 
 
 def _identify_elements(obj: object) -> object:
-    if isinstance(obj, type):
-        return _identify(obj)
-    elif isinstance(obj, list):
-        return [_identify_elements(elem) for elem in obj]
-    elif isinstance(obj, dict):
-        return Namespace({k: _identify_elements(obj[k]) for k in obj})
-    else:
+    '''
+    Return a copy of a JSON-like object, with `dict`s converted to
+    `Namespace`s and `type`s replaced by their symbols in the current scope.
+
+    Objects that don't contain any `type`s are returned unchanged.
+    '''
+    if not _contains_type(obj):
         return obj
+
+    # The tree is walked with an explicit stack, so deeply nested objects
+    # don't hit the recursion limit. Each stack entry is a container in the
+    # output and a key/index whose value still needs to be converted.
+    scope = get_scope()
+    root = [obj]
+    stack: List[Tuple[Any, Any]] = [(root, 0)]
+    while stack:
+        parent, key = stack.pop()
+        elem = parent[key]
+        if isinstance(elem, type):
+            parent[key] = _identify(elem, scope)
+        elif isinstance(elem, list):
+            parent[key] = result = list(elem)
+            stack.extend((result, i) for i in range(len(result)))
+        elif isinstance(elem, dict):
+            parent[key] = result = Namespace(elem)
+            stack.extend((result, k) for k in result)
+    return root[0]
+
+
+def _contains_type(obj: object) -> bool:
+    '''
+    Return whether a JSON-like object contains any `type`s.
+    '''
+    stack = [obj]
+    while stack:
+        elem = stack.pop()
+        if isinstance(elem, type):
+            return True
+        elif isinstance(elem, list):
+            stack.extend(elem)
+        elif isinstance(elem, dict):
+            stack.extend(elem.values())
+    return False
@@ -6,24 +6,30 @@ It also exports`namespacify`, a function that recursively converts mappings and
 namespace-like containers in JSON-like objects to `Namespace`s.
 '''
 
-from typing import Any, Dict, List, Mapping
+from typing import (
+    Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+)
 
 __all__ = ['Namespace', 'namespacify']
 
 #-- Namespaces ----------------------------------------------------------------
 
+_missing = object()
+
 class Namespace(Dict[str, Any]):
     '''
     A `dict` that supports accessing items as attributes
     '''
+    __slots__ = ()
+
     def __dir__(self) -> List[str]:
         return list(set([*dict.__dir__(self), *dict.__iter__(self)]))
 
     def __getattr__(self, key: str) -> Any:
-        try:
-            return dict.__getitem__(self, key)
-        except KeyError:
+        val = dict.get(self, key, _missing)
+        if val is _missing:
             raise AttributeError(key)
+        return val
 
     def __setattr__(self, key: str, val: object) -> None:
         dict.__setitem__(self, key, val)
@@ -36,24 +42,48 @@ class Namespace(Dict[str, Any]):
         return self
 
     def __repr__(self) -> str:
-        def single_line_repr(elem: object) -> str:
+        # Single-line reprs are abandoned as soon as they exceed the available
+        # width, and memoized, so each container's repr is built at most once
+        # per call. `cache` maps container ids to complete reprs, or to widths
+        # their reprs are known to exceed.
+        cache: Dict[int, Union[str, int]] = {}
+
+        def single_line_repr(elem: object, width: int) -> Optional[str]:
             if isinstance(elem, list):
-                return '[' + ', '.join(map(single_line_repr, elem)) + ']'
+                prefix, suffix = '[', ']'
+                items: Iterable[Tuple[str, object]] = (('', e) for e in elem)
             elif isinstance(elem, Namespace):
-                return (
-                    f'{self.__class__.__name__}('
-                    + ', '.join(
-                        f'{k}={single_line_repr(v)}'
-                        for k, v in elem.items()
-                    )
-                    + ')'
-                )
+                prefix, suffix = f'{self.__class__.__name__}(', ')'
+                items = ((f'{k}=', v) for k, v in elem.items())
             else:
-                return repr(elem).replace('\n', ' ')
+                result = repr(elem).replace('\n', ' ')
+                return result if len(result) <= width else None
+
+            cached = cache.get(id(elem))
+            if isinstance(cached, str):
+                return cached if len(cached) <= width else None
+            elif cached is not None and cached >= width:
+                return None
+
+            parts = [prefix]
+            length = len(prefix) + len(suffix)
+            for i, (label, v) in enumerate(items):
+                if i > 0:
+                    parts.append(', ')
+                    length += 2
+                v_repr = single_line_repr(v, width - length - len(label))
+                if v_repr is None:
+                    cache[id(elem)] = width
+                    return None
+                parts.append(label + v_repr)
+                length += len(label) + len(v_repr)
+            parts.append(suffix)
+            cache[id(elem)] = result = ''.join(parts)
+            return result if len(result) <= width else None
 
         def repr_in_context(elem: object, curr_col: int, indent: int) -> str:
-            sl_repr = single_line_repr(elem)
-            if len(sl_repr) <= 80 - curr_col:
+            sl_repr = single_line_repr(elem, 80 - curr_col)
+            if sl_repr is not None:
                 return sl_repr
             elif isinstance(elem, list):
                 return (
@@ -82,17 +112,29 @@ class Namespace(Dict[str, Any]):
         return repr_in_context(self, 0, 0)
 
 
+_scalar_types = frozenset({type(None), bool, int, float, str, type})
+
 def namespacify(obj: object) -> object:
     '''
     Recursively convert mappings (item access only) and ad-hoc namespaces
     (attribute access only) to `Namespace`s (both item and element access).
     '''
-    if isinstance(obj, (type(None), bool, int, float, str, type)):
+    # Exact scalar types are checked first, and scalar elements are returned
+    # without a recursive call, since they make up most of a typical tree.
+    if type(obj) in _scalar_types:
+        return obj
+    elif isinstance(obj, (type(None), bool, int, float, str, type)):
         return obj
     elif isinstance(obj, list):
-        return [namespacify(v) for v in obj]
+        return [
+            v if type(v) in _scalar_types else namespacify(v)
+            for v in obj
+        ]
     elif isinstance(obj, Mapping):
-        return Namespace({k: namespacify(obj[k]) for k in obj})
+        return Namespace({
+            k: v if type(v) in _scalar_types else namespacify(v)
+            for k, v in obj.items()
+        })
     else:
         try:
             return namespacify(vars(obj))
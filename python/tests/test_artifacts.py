@@ -1,11 +1,16 @@
+import json
+import os
 from pathlib import Path
+import shutil
 from typing import List
 
 import h5py as h5
 import numpy as np
 import pytest
 
-from artisan._artifacts import Artifact, set_root_dir
+from artisan._artifacts import Artifact, _identify_elements, set_root_dir
+from artisan._configurables import set_scope
+from artisan._namespaces import Namespace
 
 #-- Helper functions ----------------------------------------------------------
 
@@ -21,6 +26,11 @@ def data_file_concat(path: Path, args: List[Path]) -> Path:
     return path
 
 
+def index_entries(root: Path) -> List[str]:
+    lines = (root / '_index.jsonl').read_text().splitlines()
+    return sorted(json.loads(line)['p'] for line in lines)
+
+
 def assert_artifact_equals(artifact: Artifact, target: dict) -> None:
     if '__type__' in target:
         assert isinstance(artifact, target.pop('__type__'))
@@ -85,6 +95,40 @@ def test_empty_artifact_with_nonexistent_dir(tmp_path: Path) -> None:
     assert isinstance(a.nonexistent_entry, Artifact)
     assert not (tmp_path / 'new_dir').exists()
 
+#-- [Base class tests] Entry access -------------------------------------------
+
+def test_array_file_slicing(tmp_path: Path) -> None:
+    contiguous = np.arange(60, dtype='float32').reshape(3, 4, 5)
+    with h5.File(tmp_path / 'b.h5', 'w', libver='latest') as f:
+        f['data'] = contiguous
+    with h5.File(tmp_path / 'c.h5', 'w', libver='latest') as f:
+        f.create_dataset('data', data=contiguous, chunks=(1, 4, 5))
+
+    a = Artifact(tmp_path)
+    for b in [a.b, a.c]:
+        assert isinstance(b, h5.Dataset)
+        assert np.array_equal(b[()], contiguous)
+        assert np.array_equal(b[1], contiguous[1])
+        assert np.array_equal(b[1:, ..., ::2], contiguous[1:, ..., ::2])
+        assert np.array_equal(b[[0, 2]], contiguous[[0, 2]])
+        assert b[2, 3, 4] == contiguous[2, 3, 4]
+        assert np.array_equal(b.astype('f8')[0:2], contiguous[0:2])
+        assert b.astype('f8')[0:2].dtype == np.float64
+        with pytest.raises(ValueError):
+            b[::-1]
+
+def test_entries_shadowing_attributes(tmp_path: Path) -> None:
+    a = Artifact(tmp_path / 'a')
+    a['path'] = [1, 2, 3]
+    a['meta'] = {'b': [4, 5]}
+    a['c'] = [6]
+    assert {'path', 'meta', 'c'} <= set(dir(a))
+    assert a.path == tmp_path / 'a'
+    assert a.meta == {'spec': None, 'status': 'done'}
+    assert np.array_equal(a['path'][()], [1, 2, 3])
+    assert np.array_equal(a['meta'].b[()], [4, 5])
+    assert np.array_equal(a.c[()], [6])
+
 #-- [Base class tests] Entry assignment ---------------------------------------
 
 def test_float_assignment(tmp_path: Path) -> None:
@@ -187,6 +231,15 @@ def test_array_extension(tmp_path: Path) -> None:
     })
 
 
+def test_extension_chunk_size(tmp_path: Path) -> None:
+    a = Artifact(tmp_path)
+    a.extend('b', np.zeros((1, 3), dtype='uint16'))
+    a.extend('c', np.zeros((1, 100000), dtype='float64'))
+    assert a.b.chunks[0] * 3 * 2 >= 2**16
+    assert (a.b.chunks[0] - 1) * 3 * 2 < 2**16
+    assert a.c.chunks == (1, 100000)
+
+
 def test_path_extension(tmp_path: Path) -> None:
     a = Artifact(tmp_path / 'a')
     a.extend('b.bin', data_file(tmp_path / 'b0.bin'))
@@ -359,6 +412,45 @@ def test_construction_from_conf(tmp_path: Path) -> None:
     set_root_dir(Path('.'))
 
 
+def test_construction_from_conf_with_index(tmp_path: Path) -> None:
+    # Setup
+    set_root_dir(tmp_path)
+    CustomArtifact.n_calls = 0
+    (tmp_path / 'unrelated_dir').mkdir()
+    a0 = CustomArtifact(n_zeros=2, n_ones=3)
+    a1 = CustomArtifact(n_zeros=3, n_ones=2)
+    assert index_entries(tmp_path) == sorted([a0.path.name, a1.path.name])
+
+    # Case 1: (index_exists)
+    assert CustomArtifact(n_zeros=2, n_ones=3).path == a0.path
+    assert CustomArtifact(n_zeros=3, n_ones=2).path == a1.path
+    assert CustomArtifact.n_calls == 2
+
+    # Case 2: (index_does_not_exist)
+    (tmp_path / '_index.jsonl').unlink()
+    assert CustomArtifact(n_zeros=2, n_ones=3).path == a0.path
+    assert CustomArtifact(n_zeros=3, n_ones=2).path == a1.path
+    assert index_entries(tmp_path) == sorted([a0.path.name, a1.path.name])
+    assert CustomArtifact.n_calls == 2
+
+    # Case 3: (index_is_stale)
+    shutil.rmtree(a0.path)
+    a2 = CustomArtifact(n_zeros=2, n_ones=3)
+    assert a2.path != a0.path
+    assert CustomArtifact.n_calls == 3
+
+    # Case 4: (index_created_by_build)
+    (tmp_path / '_index.jsonl').unlink()
+    a3 = CustomArtifact(tmp_path / 'a3', n_zeros=4, n_ones=4)
+    assert index_entries(tmp_path) == sorted([
+        a1.path.name, a2.path.name, a3.path.name
+    ])
+    assert CustomArtifact.n_calls == 4
+
+    # Cleanup
+    set_root_dir(Path('.'))
+
+
 def test_construction_from_path_and_conf(tmp_path: Path) -> None:
     # Setup
     set_root_dir(tmp_path)
@@ -418,3 +510,110 @@ def test_build_customization(tmp_path: Path) -> None:
     a_binary = ArtifactWithUnaryBuild(tmp_path / 'binary', prop=10)
     assert a_unary.field[()] == 10
     assert a_binary.field[()] == 10
+
+#-- [Subclass tests] Metadata -------------------------------------------------
+
+def test_metadata_rewritten_externally(tmp_path: Path) -> None:
+    a = CustomArtifact(tmp_path / 'a', n_zeros=2, n_ones=3)
+    meta_path = tmp_path / 'a' / '_meta.yaml'
+    assert Artifact(a.path).meta.spec.n_zeros == 2
+    mtime_ns = meta_path.stat().st_mtime_ns
+
+    # Case 1: (same_size)
+    meta_path.write_text(meta_path.read_text().replace('2', '4'))
+    os.utime(meta_path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+    assert Artifact(a.path).meta.spec.n_zeros == 4
+
+    # Case 2: (different_size)
+    meta_path.write_text(
+        '{"spec": {"type": "ArtifactWithUnaryBuild"}, "status": "done"}'
+    )
+    assert Artifact(a.path).meta.spec == {'type': 'ArtifactWithUnaryBuild'}
+    assert isinstance(Artifact(a.path), ArtifactWithUnaryBuild)
+    with pytest.raises(FileExistsError):
+        CustomArtifact(a.path)
+
+
+def test_hand_edited_yaml_metadata(tmp_path: Path) -> None:
+    (tmp_path / 'a').mkdir()
+    (tmp_path / 'a' / '_meta.yaml').write_text(
+        'spec:\n'
+        '  type: CustomArtifact\n'
+        '  n_zeros: 2\n'
+        '  n_ones: 3\n'
+        'status: done\n'
+    )
+    a = Artifact(tmp_path / 'a')
+    assert isinstance(a, CustomArtifact)
+    assert a.conf == {'n_zeros': 2, 'n_ones': 3}
+    assert a.meta == {
+        'spec': {'type': 'CustomArtifact', 'n_zeros': 2, 'n_ones': 3},
+        'status': 'done'
+    }
+
+#-- [Subclass tests] Path generation ------------------------------------------
+
+def test_new_artifact_paths(tmp_path: Path) -> None:
+    # Setup
+    set_root_dir(tmp_path)
+    (tmp_path / 'CustomArtifact_0000').mkdir()
+    (tmp_path / 'CustomArtifact_0002').mkdir()
+
+    # Case 1: (gap_exists)
+    a0 = CustomArtifact(n_zeros=1, n_ones=0)
+    assert a0.path.name == 'CustomArtifact_0003'
+
+    # Case 2: (index_cached)
+    a1 = CustomArtifact(n_zeros=2, n_ones=0)
+    assert a1.path.name == 'CustomArtifact_0004'
+
+    # Case 3: (cached_index_taken_externally)
+    (tmp_path / 'CustomArtifact_0005').mkdir()
+    a2 = CustomArtifact(n_zeros=3, n_ones=0)
+    assert a2.path.name == 'CustomArtifact_0006'
+
+    # Cleanup
+    set_root_dir(Path('.'))
+
+#-- [Subclass tests] Spec identification --------------------------------------
+
+def test_identify_nested_types() -> None:
+    spec = {
+        'a': [1, {'b': CustomArtifact}],
+        'c': {'d': [[ArtifactWithUnaryBuild]]},
+        'e': 'f'
+    }
+    target = {
+        'a': [1, {'b': 'CustomArtifact'}],
+        'c': {'d': [['ArtifactWithUnaryBuild']]},
+        'e': 'f'
+    }
+    result = _identify_elements(spec)
+    assert result == target
+    assert isinstance(result, Namespace)
+    assert isinstance(result['c'], Namespace)
+    assert spec['a'][1]['b'] is CustomArtifact
+
+    set_scope({'Custom': CustomArtifact, 'Unary': ArtifactWithUnaryBuild})
+    try:
+        assert _identify_elements(spec) == {
+            'a': [1, {'b': 'Custom'}], 'c': {'d': [['Unary']]}, 'e': 'f'
+        }
+    finally:
+        set_scope(None)
+
+
+def test_identify_deeply_nested_types() -> None:
+    spec: object = [CustomArtifact]
+    for _ in range(5000):
+        spec = [spec]
+    result = _identify_elements(spec)
+    for _ in range(5000):
+        assert isinstance(result, list) and len(result) == 1
+        result = result[0]
+    assert result == ['CustomArtifact']
+
+
+def test_identify_type_free_spec() -> None:
+    spec = {'a': [1, {'b': 2.0}], 'c': 'd'}
+    assert _identify_elements(spec) is spec